@@ -107,7 +107,7 @@ impl Client {
         let response = self
             .client
             .abci_query(
-                Some(format!("accounts/balance/{}", &address.to_string())),
+                Some(format!("accounts/balance/{address}")),
                 vec![],
                 height,
                 false,
@@ -43,6 +43,25 @@ const TEST_INGRESS_TEMPLATE: &str = include_str!(concat!(
     "/kubernetes/ingress.yml.j2"
 ));
 
+/// The kustomize-generated documents in [`TEST_ENVIRONMENT_YAML`], deserialized once per test
+/// binary instead of on every call to [`TestEnvironment::init`].
+static TEST_ENVIRONMENT_DOCUMENTS: Lazy<Vec<serde_yaml::Value>> = Lazy::new(|| {
+    multidoc_deserialize(TEST_ENVIRONMENT_YAML).expect(
+        "should have been able to deserialize valid kustomize generated yaml; rerun `just \
+         kustomize`?",
+    )
+});
+
+/// The jinja environment holding the compiled [`TEST_INGRESS_TEMPLATE`], built once per test
+/// binary instead of on every call to [`populate_ingress_template`].
+static INGRESS_TEMPLATE_ENV: Lazy<minijinja::Environment<'static>> = Lazy::new(|| {
+    let mut jinja_env = minijinja::Environment::new();
+    jinja_env
+        .add_template("ingress.yml", TEST_INGRESS_TEMPLATE)
+        .expect("compile-time loaded ingress should be valid jinja");
+    jinja_env
+});
+
 static STOP_POD_TX: Lazy<UnboundedSender<String>> = Lazy::new(|| {
     let (tx, mut rx) = tokio::sync::mpsc::unbounded_channel();
     let _ = std::thread::spawn(move || {
@@ -129,10 +148,6 @@ impl TestEnvironment {
             .run()
             .await
             .expect("should be able to run discovery against cluster");
-        let documents = multidoc_deserialize(TEST_ENVIRONMENT_YAML).expect(
-            "should have been able to deserialize valid kustomize generated yaml; rerun `just \
-             kustomize`?",
-        );
 
         // Create the unique namespace
         create_namespace(
@@ -145,9 +160,23 @@ impl TestEnvironment {
         )
         .await;
 
-        // Apply the kustomize-generated kube yaml
+        // Apply the kustomize-generated kube yaml in two phases. The config maps and the
+        // service do not reference each other and are sent to the cluster concurrently. The
+        // deployment consumes the config maps through `envFrom` and `configMap` volumes, so it
+        // is only applied once they exist; otherwise its first pod would fail to start and be
+        // retried by kubelet with backoff.
         let ssapply = PatchParams::apply("sequencer-relayer-test").force();
-        for doc in documents {
+        let (deployments, dependencies): (Vec<_>, Vec<_>) = TEST_ENVIRONMENT_DOCUMENTS
+            .iter()
+            .cloned()
+            .partition(is_deployment_document);
+        futures::future::join_all(
+            dependencies
+                .into_iter()
+                .map(|doc| apply_yaml_value(&namespace, client.clone(), doc, &ssapply, &discovery)),
+        )
+        .await;
+        for doc in deployments {
             apply_yaml_value(&namespace, client.clone(), doc, &ssapply, &discovery).await;
         }
 
@@ -177,15 +206,21 @@ impl TestEnvironment {
         // only available once its containers are available. However, nginx (the ingress
         // controller) has a small delay between the deployment becoming available and
         // being able to route requests to its services.
-        tokio::join!(
-            wait_until_bridge_is_available(&namespace),
-            wait_until_sequencer_is_available(&namespace),
+        //
+        // The bearer token is generated by a postStart hook that has completed by the time
+        // the deployment is available, and it is read through the kubernetes API rather than
+        // the ingress, so it is extracted while waiting on nginx.
+        let http_client = reqwest::Client::builder()
+            .build()
+            .expect("building a basic reqwest client should never fail");
+        let ((), (), bearer_token) = tokio::join!(
+            wait_until_bridge_is_available(&http_client, &namespace),
+            wait_until_sequencer_is_available(&http_client, &namespace),
+            astria_test_utils::extract_bearer_token_from_celestia_node(&namespace),
         );
 
         let host = format!("http://{namespace}.localdev.me");
 
-        let bearer_token =
-            astria_test_utils::extract_bearer_token_from_celestia_node(&namespace).await;
         Self {
             host,
             namespace,
@@ -195,6 +230,10 @@ impl TestEnvironment {
     }
 }
 
+fn is_deployment_document(document: &serde_yaml::Value) -> bool {
+    document.get("kind").and_then(serde_yaml::Value::as_str) == Some("Deployment")
+}
+
 fn is_deployment_available() -> impl Condition<Deployment> {
     move |obj: Option<&Deployment>| {
         if let Some(deployment) = &obj {
@@ -312,11 +351,7 @@ async fn delete_namespace(namespace: &str, client: Client, params: &DeleteParams
 }
 
 fn populate_ingress_template(namespace: &str) -> serde_yaml::Value {
-    let mut jinja_env = minijinja::Environment::new();
-    jinja_env
-        .add_template("ingress.yml", TEST_INGRESS_TEMPLATE)
-        .expect("compile-time loaded ingress should be valid jinja");
-    let ingress_template = jinja_env
+    let ingress_template = INGRESS_TEMPLATE_ENV
         .get_template("ingress.yml")
         .expect("ingress.yml was just loaded, it should exist");
     serde_yaml::from_str(
@@ -327,36 +362,26 @@ fn populate_ingress_template(namespace: &str) -> serde_yaml::Value {
     .expect("should be able to parse rendered ingress yaml as serde_yaml Value")
 }
 
-async fn wait_until_bridge_is_available(namespace: &str) {
-    let client = reqwest::Client::builder()
-        .build()
-        .expect("building a basic reqwest client should never fail");
+async fn wait_until_bridge_is_available(client: &reqwest::Client, namespace: &str) {
     let url = reqwest::Url::parse(&format!("http://{namespace}.localdev.me/bridge/header/1"))
         .expect("bridge endpoint should be a valid url");
-    loop {
-        if client
-            .get(url.clone())
-            .send()
-            .await
-            .expect("sending a get request should not fail")
-            .error_for_status()
-            .is_ok()
-        {
-            break;
-        }
-        tokio::time::sleep(Duration::from_secs(1)).await;
-    }
+    wait_until_endpoint_is_available(client, url).await;
 }
 
-async fn wait_until_sequencer_is_available(namespace: &str) {
-    let client = reqwest::Client::builder()
-        .build()
-        .expect("building a basic reqwest client should never fail");
+async fn wait_until_sequencer_is_available(client: &reqwest::Client, namespace: &str) {
     // TODO: update this to use the sequencer `block` endpoint
     let url = reqwest::Url::parse(&format!(
         "http://{namespace}.localdev.me/sequencer/cosmos/base/tendermint/v1beta1/blocks/latest"
     ))
     .expect("sequencer endpoint should be a valid url");
+    wait_until_endpoint_is_available(client, url).await;
+}
+
+/// Polls `url` once per second until it responds with a success status.
+///
+/// `client` is shared between all readiness checks so that their polls reuse
+/// pooled keep-alive connections to the ingress controller.
+async fn wait_until_endpoint_is_available(client: &reqwest::Client, url: reqwest::Url) {
     loop {
         if client
             .get(url.clone())